@@ -4,9 +4,10 @@ import os
 import subprocess
 import sys
 import shutil
-from .config import get_ai_command, show_interactive_config, load_config
+from .config import get_ai_command, get_provider, show_interactive_config, load_config
 from .styles import print_error, print_warning
 from .prompts import build_prompt
+from .git_worker import get_git_batch
 
 CONFIG = load_config()
 
@@ -19,11 +20,9 @@ def exit_with_error(message):
 
 def is_valid_git_ref(ref):
     """Check if a ref is a valid branch (local/remote) or commit"""
-    return (
-        run_command(['git', 'show-ref', '--verify', '--quiet', f'refs/heads/{ref}']) is not None or
-        run_command(['git', 'show-ref', '--verify', '--quiet', f'refs/remotes/{ref}']) is not None or
-        run_command(['git', 'cat-file', '-e', ref]) is not None
-    )
+    # Branch names resolve through refs/heads and refs/remotes, so a single
+    # lookup against the shared cat-file process covers all three cases
+    return get_git_batch().exists(ref)
 
 
 def is_branch(ref):
@@ -39,7 +38,7 @@ def interactive_select(items, message, key_name='item'):
     Generic interactive selector using inquirer.
 
     Args:
-        items: List of tuples (display_text, value)
+        items: Dict mapping display_text to value, in display order
         message: The prompt message to show
         key_name: The key name for inquirer (used internally)
 
@@ -52,7 +51,7 @@ def interactive_select(items, message, key_name='item'):
         questions = [
             inquirer.List(key_name,
                          message=message,
-                         choices=[item[0] for item in items],
+                         choices=list(items),
                          carousel=True)
         ]
 
@@ -60,43 +59,102 @@ def interactive_select(items, message, key_name='item'):
         if not answers:
             exit_with_error("Selection cancelled")
 
-        selected_text = answers[key_name]
-        for display_text, value in items:
-            if display_text == selected_text:
-                return value
-
-        exit_with_error("Selection failed")
+        try:
+            return items[answers[key_name]]
+        except KeyError:
+            exit_with_error("Selection failed")
 
     except KeyboardInterrupt:
         exit_with_error("Selection cancelled")
 
-def check_dependencies():
-    """Check if required CLIs are available"""
-    current_provider = CONFIG.get('ai_provider')
+_PATH_INDEX = None
 
-    ai_cmd = CONFIG.get('providers').get(current_provider).get('command')[0]
-    if not shutil.which(ai_cmd):
-        exit_with_error(f"'{ai_cmd}' CLI not found in PATH")
 
-    if not shutil.which('git'):
-        exit_with_error("'git' CLI not found in PATH")
+def _path_index():
+    """Map executable names on PATH to their full path, scanning each directory once (Windows only)"""
+    global _PATH_INDEX
+    if _PATH_INDEX is not None:
+        return _PATH_INDEX
 
-    try:
-        import pyperclip
-    except ImportError:
-        exit_with_error("pyperclip not installed. Install with: pip install pyperclip")
+    pathext = [ext.lower() for ext in os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').split(';') if ext]
 
-def run_command(cmd, shell=None):
-    """Run command and return output, handle errors gracefully"""
-    import os
+    index = {}
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        if not directory:
+            continue
+        # Within a directory the earliest PATHEXT extension wins, so npm's
+        # gemini.cmd is picked over the extensionless sh script next to it
+        found = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    name = entry.name.lower()
+                    stem, ext = os.path.splitext(name)
+                    if ext not in pathext:
+                        continue
+                    rank = pathext.index(ext)
+                    index.setdefault(name, entry.path)
+                    if stem not in found or rank < found[stem][0]:
+                        found[stem] = (rank, entry.path)
+        except OSError:
+            continue
+        # Earlier PATH entries win, same as shutil.which
+        for stem, (_, path) in found.items():
+            index.setdefault(stem, path)
+
+    _PATH_INDEX = index
+    return index
+
+
+def find_executable(cmd):
+    """Return the full path of a command on PATH, or None"""
+    # shutil.which re-lists PATH on every call, which is only costly on
+    # Windows where each PATHEXT extension multiplies the stat calls
+    if os.name != 'nt' or os.path.dirname(cmd):
+        return shutil.which(cmd)
+    return _path_index().get(cmd.lower())
+
+
+def check_dependencies():
+    """Check if required CLIs are available"""
+    # get_ai_command reports an unknown provider; only check the fallback here
+    provider = get_provider(CONFIG, warn=False)
+    ai_cmd = CONFIG['providers'][provider]['command'][0]
+    for cmd in [ai_cmd, 'git']:
+        if not find_executable(cmd):
+            exit_with_error(f"'{cmd}' CLI not found in PATH")
+
+def resolve_command(cmd):
+    """On Windows, replace the program name in an argv list with its full path from PATH.
+
+    Lets Windows launch .cmd/.bat shims (npm-installed CLIs) without shell=True.
+    Elsewhere execvp already searches PATH, so cmd is returned unchanged.
+    """
+    if os.name != 'nt':
+        return cmd
+    path = find_executable(cmd[0])
+    return [path, *cmd[1:]] if path else list(cmd)
 
-    if shell is None:
-        shell = os.name == 'nt'
+def git_diff_command(subcommand, *args):
+    """Build a `git show`/`git diff` argv that ignores pager, color and external diff settings"""
+    return ['git', '--no-pager', '-c', 'color.ui=never', subcommand, '--no-color', '--no-ext-diff', *args]
 
+def run_command(cmd, text=True):
+    """Run command and return output, handle errors gracefully.
+
+    With text=False the raw stdout bytes are returned undecoded and unstripped.
+    """
     try:
+        if not text:
+            return subprocess.run(resolve_command(cmd), capture_output=True, check=True).stdout
+
         result = subprocess.run(
-            cmd if isinstance(cmd, list) else cmd,
-            shell=shell,
+            resolve_command(cmd),
             capture_output=True,
             text=True,
             check=True,
@@ -104,62 +162,201 @@ def run_command(cmd, shell=None):
             errors='replace',
         )
         return result.stdout.strip() if result.stdout else ""
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         return None
     except KeyboardInterrupt:
         exit_with_error("Operation cancelled")
 
+PR_CACHE_TTL = 60  # seconds
+
+
+def _pr_cache_path(repo=None):
+    """Cache file for the PR list of a repo, or None if the repo can't be identified"""
+    import hashlib
+
+    key = repo or run_command(['git', 'config', '--get', 'remote.origin.url'])
+    if not key:
+        return None
+
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, 'explain-cli', f'pr-list-{digest}.json')
+
+
+def _read_pr_cache(path):
+    """Return cached PR list output if it is younger than PR_CACHE_TTL"""
+    import time
+
+    try:
+        if time.time() - os.path.getmtime(path) >= PR_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_pr_cache(path, content):
+    """Atomically replace the cached PR list output"""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path), delete=False) as f:
+            f.write(content)
+        os.replace(f.name, path)
+    except OSError:
+        # Caching is best effort
+        pass
+
+
+AI_PIPE_CHUNK_SIZE = 64 * 1024
+
+
+async def run_ai_command(ai_command, input_text, on_output=None):
+    """Feed input to the AI provider and return its stdout.
+
+    If on_output is given it is called with each line of output as soon as the
+    provider emits it.
+    """
+    import asyncio
+    import codecs
+
+    # Python-based provider wrappers would otherwise block-buffer their output
+    env = dict(os.environ, PYTHONUNBUFFERED='1')
+    process = await asyncio.create_subprocess_exec(
+        *resolve_command(ai_command),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+
+    async def feed_stdin():
+        data = input_text.encode('utf-8')
+        try:
+            for i in range(0, len(data), AI_PIPE_CHUNK_SIZE):
+                process.stdin.write(data[i:i + AI_PIPE_CHUNK_SIZE])
+                await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # Provider exited early; its return code tells us why
+            pass
+
+    async def read_stdout():
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        chunks = []
+        pending = ''
+
+        def emit(line):
+            chunks.append(line)
+            if on_output:
+                on_output(line)
+
+        while True:
+            data = await process.stdout.read(AI_PIPE_CHUNK_SIZE)
+            if not data:
+                break
+            *lines, pending = (pending + decoder.decode(data)).split('\n')
+            for line in lines:
+                emit(line.rstrip('\r') + '\n')
+
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            emit(pending)
+        return ''.join(chunks)
+
+    # Writing and reading run side by side so a provider that starts answering
+    # before it has read all of its input can't deadlock on a full pipe
+    _, output = await asyncio.gather(feed_stdin(), read_stdout())
+    returncode = await process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, ai_command, output=output)
+    return output
+
+async def get_explanation(ai_command, input_text, provider, clipboard=False):
+    """Run the AI provider, streaming its answer to the terminal, and return the result.
+
+    In clipboard mode nothing is printed; pyperclip is imported while the
+    provider is still generating and the result is copied off the event loop.
+    """
+    import asyncio
+    import importlib
+    from .styles import create_spinner, ResultStream, print_clipboard_success
+
+    loop = asyncio.get_running_loop()
+    clipboard_module = loop.run_in_executor(None, importlib.import_module, 'pyperclip') if clipboard else None
+
+    with create_spinner("Getting explanation...", provider=provider) as spinner:
+        # Print the answer as it arrives unless it's headed for the clipboard
+        stream = ResultStream(spinner, render=not clipboard)
+        await run_ai_command(ai_command, input_text, on_output=stream.feed)
+    result = stream.close()
+
+    if clipboard:
+        pyperclip = await clipboard_module
+        await loop.run_in_executor(None, pyperclip.copy, result)
+        print_clipboard_success()
+
+    return result
+
 def select_pr_interactive(repo=None):
     """Show PR list and let user select one using a native CLI dropdown"""
-    import json
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
 
-    if not shutil.which('gh'):
+    if not find_executable('gh'):
         exit_with_error("GitHub CLI (gh) not available - PR selection requires gh CLI")
 
     cmd = ['gh', 'pr', 'list', '--state', 'all', '--json', 'number,title,author,state']
     if repo:
         cmd.extend(['--repo', repo])
 
-    pr_list_output = run_command(cmd)
-    if not pr_list_output:
+    cache_path = _pr_cache_path(repo)
+    pr_list_output = _read_pr_cache(cache_path) if cache_path else None
+    if pr_list_output is None:
+        pr_list_output = run_command(cmd, text=False)
+        if pr_list_output and cache_path:
+            _write_pr_cache(cache_path, pr_list_output)
+
+    if not pr_list_output or not pr_list_output.strip():
         exit_with_error(f"No pull requests found{f' in {repo}' if repo else ''}")
 
     try:
-        prs = json.loads(pr_list_output)
-    except json.JSONDecodeError:
+        prs = json_loads(pr_list_output)
+    except ValueError:
         exit_with_error("Failed to parse PR list")
 
     if not prs:
         exit_with_error(f"No pull requests found{f' in {repo}' if repo else ''}")
 
-    choices = []
+    choices = {}
     for pr in prs:
         state_indicator = "🟢" if pr['state'] == 'OPEN' else "🔴" if pr['state'] == 'CLOSED' else "🟣"
         choice_text = f"#{pr['number']}: {pr['title']} (@{pr['author']['login']}) {state_indicator}"
-        choices.append((choice_text, pr['number']))
+        choices[choice_text] = pr['number']
 
     return interactive_select(choices, "Select a pull request", 'pr')
 
 def select_commit_interactive():
     """Show recent commits and let user select one"""
-    commit_log = run_command(['git', 'log', '--oneline', '--decorate', '--color=never', '-20'])
+    # NUL-terminated records of "<short sha>\x1f<subject>"
+    commit_log = run_command(['git', 'log', '-z', '--format=%h%x1f%s', '-20'], text=False)
     if not commit_log:
         exit_with_error("No commits found in repository")
 
-    commit_lines = commit_log.strip().split('\n')
     commits = []
-
-    for line in commit_lines:
-        parts = line.split(' ', 1)
-        if len(parts) >= 2:
-            sha = parts[0]
-            message = parts[1] if len(parts) > 1 else "No message"
-            commits.append((sha, message))
+    for record in commit_log.split(b'\x00'):
+        sha, _, message = record.partition(b'\x1f')
+        if sha:
+            commits.append((sha.decode('utf-8', 'replace'), message.decode('utf-8', 'replace') or "No message"))
 
     if not commits:
         exit_with_error("No commits found")
 
-    choices = [(f"{sha}: {message}", sha) for sha, message in commits]
+    choices = {f"{sha}: {message}": sha for sha, message in commits}
     return interactive_select(choices, "Select a commit", 'commit')
 
 def select_branch_interactive(message="Select a branch", include_current=True):
@@ -196,7 +393,7 @@ def select_branch_interactive(message="Select a branch", include_current=True):
         exit_with_error("No selectable branches found")
 
     # Create choices for the dropdown menu
-    choices = []
+    choices = {}
     for branch, branch_type, is_current in branches:
         if is_current:
             choice_text = f"{branch} (current)"
@@ -204,7 +401,7 @@ def select_branch_interactive(message="Select a branch", include_current=True):
             choice_text = f"{branch} (remote)"
         else:
             choice_text = branch
-        choices.append((choice_text, branch))
+        choices[choice_text] = branch
 
     return interactive_select(choices, message, 'branch')
 
@@ -212,7 +409,7 @@ def explain_pr(pr_spec=None, force_select=False, repo=None):
     """Handle pull request explanation. Returns (base_prompt, diff_content)."""
     from .prompts import EXPLAIN_PR_BP
 
-    if not shutil.which('gh'):
+    if not find_executable('gh'):
         exit_with_error("GitHub CLI (gh) not available - PR explanation requires gh CLI")
 
     def get_pr_diff(pr_num=None):
@@ -241,13 +438,13 @@ def explain_pr(pr_spec=None, force_select=False, repo=None):
             pr_number = select_pr_interactive(repo=repo)
             diff_content = get_pr_diff(pr_number)
         else:
-            # Try current PR, fallback to selection if not in PR branch
-            current_pr_check = run_command(['gh', 'pr', 'view'])
-            if current_pr_check is None or current_pr_check == "":
+            # Try current PR, fallback to selection if not in PR branch.
+            # gh pr diff resolves the branch's PR itself and fails when there
+            # is none, so no separate gh pr view lookup is needed.
+            diff_content = get_pr_diff()
+            if diff_content is None:
                 pr_number = select_pr_interactive()
                 diff_content = get_pr_diff(pr_number)
-            else:
-                diff_content = get_pr_diff()
 
     if not diff_content or diff_content == "":
         exit_with_error("Could not get PR diff or PR has no changes")
@@ -274,7 +471,7 @@ def explain_commit(ref='HEAD', force_select=False):
             except (KeyboardInterrupt, EOFError):
                 sys.exit(1)
 
-    diff_content = run_command(['git', 'show', ref])
+    diff_content = run_command(git_diff_command('show', ref))
     if not diff_content:
         exit_with_error("Could not get commit diff")
 
@@ -287,7 +484,7 @@ def explain_diff(ref):
     if not is_valid_git_ref(ref):
         exit_with_error(f"Could not find commit '{ref}'. Please provide a valid commit SHA, tag, or branch.")
 
-    diff_content = run_command(['git', 'diff', ref])
+    diff_content = run_command(git_diff_command('diff', ref))
     if not diff_content:
         exit_with_error(f"No differences found between current state and commit '{ref}'")
 
@@ -304,10 +501,13 @@ def explain_branch_diff(branch_spec, force_select=False, file_patterns=None):
             exit_with_error("Invalid branch range format. Use: branch1..branch2")
         from_branch, to_branch = branches[0].strip(), branches[1].strip()
         comparison_type = "range"
+        refs_to_validate = [from_branch, to_branch]
     elif force_select:
         from_branch = select_branch_interactive("Select first branch (FROM)", include_current=True)
         to_branch = select_branch_interactive("Select second branch (TO)", include_current=True)
         comparison_type = "range"
+        # Both picked from git's own branch list
+        refs_to_validate = []
     elif branch_spec == "HEAD" or not branch_spec:
         current_branch = run_command(['git', 'branch', '--show-current'])
         if not current_branch:
@@ -326,37 +526,38 @@ def explain_branch_diff(branch_spec, force_select=False, file_patterns=None):
         from_branch = main_branch
         to_branch = current_branch
         comparison_type = "current_vs_main"
+        # The base branch was either confirmed by is_branch or picked from
+        # git's branch list. The current branch may be unborn (no commits yet),
+        # so it still needs checking.
+        refs_to_validate = [to_branch]
     else:
         from_branch = branch_spec
         to_branch = None
         comparison_type = "branch_vs_working"
+        refs_to_validate = [from_branch]
 
-    # Validate branches exist
-    if comparison_type != "branch_vs_working":
-        for branch in [from_branch, to_branch]:
-            if not is_valid_git_ref(branch):
-                exit_with_error(f"Could not find branch or commit '{branch}'")
-    else:
-        if not is_valid_git_ref(from_branch):
-            exit_with_error(f"Could not find branch or commit '{from_branch}'")
-
-    # Build git diff command
-    git_cmd = ['git', 'diff']
-    if file_patterns:
-        git_cmd.extend(['--'])
-        git_cmd.extend(file_patterns)
+    # Validate user-supplied branches exist
+    for branch in refs_to_validate:
+        if not is_valid_git_ref(branch):
+            exit_with_error(f"Could not find branch or commit '{branch}'")
 
     # Determine diff range and create appropriate prompt
     if comparison_type == "range":
-        git_cmd.insert(2, f"{from_branch}..{to_branch}")
+        diff_range = f"{from_branch}..{to_branch}"
         base_prompt = EXPLAIN_BRANCH_BP(from_branch, to_branch)
     elif comparison_type == "current_vs_main":
-        git_cmd.insert(2, f"{from_branch}..{to_branch}")
+        diff_range = f"{from_branch}..{to_branch}"
         base_prompt = EXPLAIN_BRANCH_CURRENT_VS_MAIN_BP(from_branch, to_branch)
     else:
-        git_cmd.insert(2, from_branch)
+        diff_range = from_branch
         base_prompt = EXPLAIN_BRANCH_CURRENT_VS_WORKING_BP(from_branch, to_branch)
 
+    # Build git diff command
+    git_cmd = git_diff_command('diff', diff_range)
+    if file_patterns:
+        git_cmd.append('--')
+        git_cmd.extend(file_patterns)
+
     diff_content = run_command(git_cmd)
     if not diff_content:
         if comparison_type == "range":
@@ -463,38 +664,26 @@ Examples:
         base_prompt, diff_content = explain_commit(args.commit, force_select=args.select)
 
     # Build final prompt with CLI overrides (if any)
-    prompt = build_prompt(base_prompt, verbosity_override=args.verbosity, style_override=args.style)
+    prompt = build_prompt(base_prompt, verbosity_override=args.verbosity, style_override=args.style, config=CONFIG)
 
     # Send to AI provider
-    from .styles import create_spinner, print_result, print_clipboard_success, ask_copy_raw
+    import asyncio
+    from .styles import ask_copy_raw
+
+    if sys.platform == 'win32' and sys.version_info < (3, 8):
+        # Subprocesses need the proactor loop, which only became the default in 3.8
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
     try:
-        ai_command, provider = get_ai_command(prompt)
+        ai_command, provider = get_ai_command(prompt, config=CONFIG)
 
         diff_content = (diff_content or "") + "\n\n" + prompt
-        use_shell = os.name == 'nt'
-        with create_spinner("Getting explanation...", provider=provider):
-            process = subprocess.run(
-                ai_command,  # Pass as list
-                input=diff_content,
-                check=True,
-                capture_output=True,
-                encoding='utf-8',
-                errors='replace',
-                shell=use_shell
-            )
-
-        result = process.stdout.strip()
-
-        if args.clipboard:
-            import pyperclip
-            pyperclip.copy(result)
-            print_clipboard_success()
-        else:
-            print_result(result, is_markdown=True)
+        result = asyncio.run(get_explanation(ai_command, diff_content, provider, clipboard=args.clipboard))
+
+        if not args.clipboard:
             ask_copy_raw(result)
 
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         exit_with_error(f"Failed to run {provider} command")
     except KeyboardInterrupt:
         exit_with_error("Operation cancelled")
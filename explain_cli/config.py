@@ -25,43 +25,65 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Parsed config.json, reused until the file's mtime changes
+_CACHE = {'mtime': None, 'data': None}
+
 def load_config():
     """Load configuration from file, create default if doesn't exist"""
-    if not CONFIG_FILE.exists():
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
         save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG.copy()
-    
+
+    if st.st_mtime == _CACHE['mtime']:
+        return _CACHE['data']
+
     try:
         with open(CONFIG_FILE, 'r') as f:
             config = json.load(f)
         # Merge with defaults to ensure all keys exist
         merged_config = DEFAULT_CONFIG.copy()
         merged_config.update(config)
-        return merged_config
     except (json.JSONDecodeError, IOError):
         # Return default config if file is corrupted
         return DEFAULT_CONFIG.copy()
 
+    _CACHE['mtime'] = st.st_mtime
+    _CACHE['data'] = merged_config
+    return merged_config
+
 def save_config(config):
     """Save configuration to file"""
+    _CACHE['mtime'] = None
     try:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=2)
     except IOError as e:
         print(f"Warning: Could not save config: {e}", file=sys.stderr)
 
-def get_ai_command(prompt):
-    """Get the AI command based on current configuration"""
-    config = load_config()
-    provider = config.get('ai_provider', 'gemini')
-    
+def get_provider(config, warn=True):
+    """Return the configured provider name, falling back to gemini if it isn't defined.
+
+    The fallback is not written back to the config, so saving it later keeps
+    the user's setting.
+    """
+    provider = config['ai_provider']
     if provider not in config['providers']:
-        print(f"Error: Unknown provider '{provider}'. Available: {list(config['providers'].keys())}", file=sys.stderr)
+        if warn:
+            print(f"Error: Unknown provider '{provider}'. Available: {list(config['providers'].keys())}", file=sys.stderr)
         provider = 'gemini'  # Fallback to default
-    
-    command = config['providers'][provider]['command'].copy()
-    command.append(prompt)
-    return command, provider
+    return provider
+
+def get_ai_command(prompt, config=None):
+    """Get the AI command based on current configuration"""
+    if config is None:
+        config = load_config()
+    provider = get_provider(config)
+
+    # Build a fresh list so callers never alias the (cached) config's command
+    base = config['providers'][provider]['command']
+    return [*base, prompt], provider
 
 def set_provider(provider_name):
     """Set the AI provider"""
@@ -131,85 +153,80 @@ def _configure_provider(config):
     current_provider = config.get('ai_provider', 'gemini')
     
     # Create provider choices with colors
-    choices = []
+    choices = {}
     for name, details in config['providers'].items():
         color = details.get('color', 'cyan')
         if name == current_provider:
             choice_text = f"{name} - {details['description']} (current)"
         else:
             choice_text = f"{name} - {details['description']}"
-        choices.append((choice_text, name))
+        choices[choice_text] = name
     
     try:
         questions = [
             inquirer.List('provider',
                          message="Select AI provider",
-                         choices=[choice[0] for choice in choices],
+                         choices=list(choices),
                          carousel=True)
         ]
         
         answers = inquirer.prompt(questions)
         if answers:
-            # Find the provider name for the selected choice
-            selected_text = answers['provider']
-            for choice_text, provider_name in choices:
-                if choice_text == selected_text:
-                    config['ai_provider'] = provider_name
-                    save_config(config)
-                    console.print(f"[green]✓[/green] Provider set to {provider_name}")
-                    break
+            provider_name = choices[answers['provider']]
+            config['ai_provider'] = provider_name
+            save_config(config)
+            console.print(f"[green]✓[/green] Provider set to {provider_name}")
                     
     except KeyboardInterrupt:
         pass
 
-def _configure_verbosity(config):
-    """Configure verbosity level"""
+def _configure_option(config, key, default, options, message, label):
+    """Let the user pick one of `options` (value -> description) for config[key]"""
     import inquirer
     from rich.console import Console
-    
+
     console = Console(stderr=True)
-    current_verbosity = config.get('verbosity', 'balanced')
-    
-    verbosity_options = {
-        'concise': 'Short and sweet',
-        'balanced': 'Good detail without being overwhelming',
-        'hyperdetailed': 'Comprehensive explanations'
-    }
-    
+    current = config.get(key, default)
+
     choices = []
-    for level, description in verbosity_options.items():
-        if level == current_verbosity:
-            choices.append(f"{level} - {description} (current)")
+    for value, description in options.items():
+        if value == current:
+            choices.append(f"{value} - {description} (current)")
         else:
-            choices.append(f"{level} - {description}")
-    
+            choices.append(f"{value} - {description}")
+
     try:
         questions = [
-            inquirer.List('verbosity',
-                         message="Select verbosity level",
+            inquirer.List(key,
+                         message=message,
                          choices=choices,
                          carousel=True)
         ]
 
         answers = inquirer.prompt(questions)
         if answers:
-            selected = answers['verbosity'].split(' - ')[0]
-            config['verbosity'] = selected
+            selected = answers[key].split(' - ')[0]
+            config[key] = selected
             save_config(config)
-            console.print(f"[green]✓[/green] Verbosity set to {selected}")
+            console.print(f"[green]✓[/green] {label} set to {selected}")
 
     except KeyboardInterrupt:
         pass
 
 
-def _configure_response_style(config):
-    """Configure response style for different audiences"""
-    import inquirer
-    from rich.console import Console
+def _configure_verbosity(config):
+    """Configure verbosity level"""
+    verbosity_options = {
+        'concise': 'Short and sweet',
+        'balanced': 'Good detail without being overwhelming',
+        'hyperdetailed': 'Comprehensive explanations'
+    }
+    _configure_option(config, 'verbosity', 'balanced', verbosity_options,
+                      "Select verbosity level", "Verbosity")
 
-    console = Console(stderr=True)
-    current_style = config.get('response_style', 'default')
 
+def _configure_response_style(config):
+    """Configure response style for different audiences"""
     style_options = {
         'default': 'General developer audience',
         'code_review': 'Technical code review (implementation details)',
@@ -217,31 +234,8 @@ def _configure_response_style(config):
         'nontechnical': 'Non-technical readers (simple terms)',
         'technical': 'Developers (precise technical details)'
     }
-
-    choices = []
-    for style, description in style_options.items():
-        if style == current_style:
-            choices.append(f"{style} - {description} (current)")
-        else:
-            choices.append(f"{style} - {description}")
-
-    try:
-        questions = [
-            inquirer.List('style',
-                         message="Select response style",
-                         choices=choices,
-                         carousel=True)
-        ]
-
-        answers = inquirer.prompt(questions)
-        if answers:
-            selected = answers['style'].split(' - ')[0]
-            config['response_style'] = selected
-            save_config(config)
-            console.print(f"[green]✓[/green] Response style set to {selected}")
-
-    except KeyboardInterrupt:
-        pass
+    _configure_option(config, 'response_style', 'default', style_options,
+                      "Select response style", "Response style")
 
 
 def _configure_response_structure(config):
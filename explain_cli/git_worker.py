@@ -0,0 +1,65 @@
+"""Long-running git helper used to resolve refs without spawning a process per lookup."""
+
+import atexit
+import subprocess
+
+
+class GitBatch:
+    """Persistent `git cat-file --batch-check` process fed via stdin."""
+
+    def __init__(self):
+        self._process = None
+
+    def open(self):
+        """Start the cat-file process if it isn't running yet"""
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,
+            )
+        return self
+
+    def close(self):
+        """Shut down the cat-file process"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        process.stdout.close()
+        process.wait()
+
+    def exists(self, ref):
+        """Check if a ref resolves to an object, same as `git cat-file -e`"""
+        if not ref or '\n' in ref:
+            return False
+
+        self.open()
+        try:
+            self._process.stdin.write(ref.encode('utf-8') + b'\n')
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except (BrokenPipeError, OSError):
+            # git exits immediately outside a repository
+            self.close()
+            return False
+
+        # Missing refs come back as "<ref> missing" (or "ambiguous")
+        return bool(line) and not line.rstrip().endswith((b' missing', b' ambiguous'))
+
+
+_batch = None
+
+
+def get_git_batch():
+    """Return the shared GitBatch for this process, started on first use"""
+    global _batch
+    if _batch is None:
+        _batch = GitBatch()
+        atexit.register(_batch.close)
+    return _batch
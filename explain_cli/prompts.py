@@ -58,7 +58,7 @@ def get_prompt_for_verbosity(base_prompt, verbosity):
     return modifier + base_prompt
 
 
-def build_prompt(base_prompt, verbosity_override=None, style_override=None, structure_override=None):
+def build_prompt(base_prompt, verbosity_override=None, style_override=None, structure_override=None, config=None):
     """
     Build a complete prompt with verbosity, response style, and structure settings.
 
@@ -67,11 +67,13 @@ def build_prompt(base_prompt, verbosity_override=None, style_override=None, stru
         verbosity_override: Optional verbosity level to use instead of config
         style_override: Optional response style to use instead of config
         structure_override: Optional response structure to use instead of config
+        config: Already loaded config (loaded from disk if omitted)
 
     Returns:
         Complete prompt string with all modifiers applied
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
     verbosity = verbosity_override or config.get('verbosity', 'balanced')
     response_style = style_override or config.get('response_style', 'default')
     response_structure = structure_override if structure_override is not None else config.get('response_structure', '')
@@ -24,16 +24,63 @@ def print_provider(provider):
     """Print which AI provider is being used"""
     console.print(f"[dim]Using {provider} AI provider...[/dim]")
 
-def print_result(content, is_markdown=True):
-    """Print the AI result with nice formatting"""
-    if is_markdown:
-        # Rich can render markdown beautifully
+class ResultStream:
+    """Collect streamed AI output, printing each markdown block once it is complete"""
+
+    def __init__(self, spinner=None, render=True):
+        self.spinner = spinner
+        self.render = render
+        self._lines = []
+        self._block = []
+        self._in_fence = False
+        self._ends_blank = True  # nothing printed yet, so no separator needed
+
+    def feed(self, line):
+        """Add a line of output; a blank line outside a code fence ends a block"""
+        self._lines.append(line)
+        if not self.render:
+            return
+
+        if self.spinner:
+            self.spinner.stop()
+            self.spinner = None
+
+        self._block.append(line)
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            self._in_fence = not self._in_fence
+        elif not stripped and not self._in_fence:
+            self._flush()
+
+    def close(self):
+        """Print whatever is left and return the full result"""
+        if self.render:
+            self._flush()
+        return ''.join(self._lines).strip()
+
+    def _flush(self):
         from rich.markdown import Markdown
-        md = Markdown(content)
-        console.print(md)
-    else:
-        # For plain text, just print normally to stdout (not stderr)
-        print(content)
+        from rich.segment import Segments
+
+        block = ''.join(self._block).strip()
+        self._block = []
+        if not block:
+            return
+
+        # Render only the completed block so cost stays linear in the answer.
+        # Markdown that spans blocks isn't reconciled: a reference link whose
+        # definition arrives in a later block prints literally.
+        lines = console.render_lines(Markdown(block), console.options, new_lines=True)
+        # Lists and code blocks already start or end with a blank line; only
+        # add a separator when neither side has one, so blocks stay one line apart
+        if not self._ends_blank and not self._is_blank(lines[0]):
+            console.print()
+        console.print(Segments(segment for line in lines for segment in line), end='')
+        self._ends_blank = self._is_blank(lines[-1])
+
+    @staticmethod
+    def _is_blank(line):
+        return not ''.join(segment.text for segment in line).strip()
 
 def print_config(config):
     """Print configuration with nice formatting"""